@@ -1,23 +1,15 @@
 import numpy as np
-import scipy.linalg as la
-import scipy.signal as sig
 import matplotlib.pyplot as plt
 
-def bode_mag_phase(num, den, w):
-    w, h = sig.freqs(num, den, worN=w)
+def tf_eval(num, den, s):
+    # evaluate num(s)/den(s) directly on s = jw (Horner via polyval)
+    return np.polyval(num, s) / np.polyval(den, s)
+
+def bode_mag_phase(h):
     mag_db = 20*np.log10(np.abs(h))
     ph_deg = np.unwrap(np.angle(h))*180/np.pi
     return mag_db, ph_deg
 
-def tf_series(num1, den1, num2, den2):
-    return np.polymul(num1, num2), np.polymul(den1, den2)
-
-def tf_feedback(num_ol, den_ol):  # 1/(1+L) with unity feedback for closed-loop from ref->output: L/(1+L)
-    # Closed-loop T = L/(1+L)
-    num_cl = num_ol
-    den_cl = np.polyadd(den_ol, num_ol)
-    return num_cl, den_cl
-
 def demo_pole_zero_nearcancel():
     w = np.logspace(-2, 2, 1000) * 2*np.pi  # rad/s
 
@@ -34,16 +26,21 @@ def demo_pole_zero_nearcancel():
     C_num = K * np.array([1/z, 1.0])     # K*(s/z + 1)
     C_den = np.array([1/p, 1.0])         # (s/p + 1)
 
+    # Evaluate each system once on s = jw and combine the responses pointwise
+    s = 1j*w
+    P = tf_eval(P_num, P_den, s)
+    Cs = tf_eval(C_num, C_den, s)
+
     # Open-loop: L = C*P
-    L_num, L_den = tf_series(C_num, C_den, P_num, P_den)
+    L = Cs * P
 
     # Closed-loop complementary sensitivity T = L/(1+L)
-    T_num, T_den = tf_feedback(L_num, L_den)
+    T = L / (1 + L)
 
     # Bode plots
-    magP, phP = bode_mag_phase(P_num, P_den, w)
-    magL, phL = bode_mag_phase(L_num, L_den, w)
-    magT, phT = bode_mag_phase(T_num, T_den, w)
+    magP, phP = bode_mag_phase(P)
+    magL, phL = bode_mag_phase(L)
+    magT, phT = bode_mag_phase(T)
 
     f = w/(2*np.pi)
     plt.figure(figsize=(10,5))
@@ -1,8 +1,17 @@
 import numpy as np
-import scipy.linalg as la
-import scipy.signal as sig
 import matplotlib.pyplot as plt
 
+def ss_freq_response(A, B, C, D, w):
+    # H(jw) = C(jwI-A)^{-1}B + D for every w at once -> shape (len(w), n_out, n_in)
+    # stack of jwI - A without an identity matrix: copy -A, then add jw on the diagonals
+    n = A.shape[0]
+    M = np.empty((len(w), n, n), dtype=complex)
+    M[:] = -A
+    M[:, np.arange(n), np.arange(n)] += 1j*w[:, None]
+    # solve (jwI-A) X = B rather than forming the inverse (batched over w)
+    X = np.linalg.solve(M, np.broadcast_to(B, (len(w),) + B.shape))
+    return C @ X + D
+
 def demo_statespace_to_tf():
     # A lightly coupled 2-DoF toy system (positions & velocities)
     # x = [x1, v1, x2, v2]^T
@@ -21,11 +30,8 @@ def demo_statespace_to_tf():
 
     # Frequency response H(jw) = C(jwI-A)^{-1}B + D
     w = np.logspace(-2, 2, 1000) * 2*np.pi
-    H11, H21 = [], []
-    for wi in w:
-        G = C @ la.inv(1j*wi*np.eye(4) - A) @ B + D
-        H11.append(G[0,0]); H21.append(G[1,0])
-    H11 = np.array(H11); H21 = np.array(H21)
+    G = ss_freq_response(A, B, C, D, w)
+    H11 = G[:,0,0]; H21 = G[:,1,0]
 
     f = w/(2*np.pi)
     plt.figure(figsize=(10,5))
@@ -47,11 +53,8 @@ def demo_statespace_to_tf():
     Dcl = D.copy()
 
     # Compute closed-loop frequency response
-    H11_cl, H21_cl = [], []
-    for wi in w:
-        Gcl = Ccl @ la.inv(1j*wi*np.eye(4) - Acl) @ Bcl + Dcl
-        H11_cl.append(Gcl[0,0]); H21_cl.append(Gcl[1,0])
-    H11_cl = np.array(H11_cl); H21_cl = np.array(H21_cl)
+    Gcl = ss_freq_response(Acl, Bcl, Ccl, Dcl, w)
+    H11_cl = Gcl[:,0,0]; H21_cl = Gcl[:,1,0]
 
     plt.figure(figsize=(10,5))
     plt.semilogx(f, 20*np.log10(np.abs(H11_cl)), label='|x1/r| (closed-loop)')
@@ -73,11 +76,8 @@ def demo_statespace_to_tf():
 
     # Frequency responses from r -> outputs
     def frf(A_mat):
-        H11_cl, H21_cl = [], []
-        for wi in w:
-            Gcl = C @ la.inv(1j*wi*np.eye(4) - A_mat) @ B + D
-            H11_cl.append(Gcl[0,0]); H21_cl.append(Gcl[1,0])
-        return np.array(H11_cl), np.array(H21_cl)
+        Gcl = ss_freq_response(A_mat, B, C, D, w)
+        return Gcl[:,0,0], Gcl[:,1,0]
 
     H11_P,  H21_P  = frf(Acl_P)
     H11_PD, H21_PD = frf(Acl_PD)
@@ -1,7 +1,7 @@
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from matplotlib.gridspec import GridSpec
-from matplotlib import cm
 matplotlib.use("Qt5Agg")
 import numpy as np
 
@@ -13,6 +13,15 @@ frequencies = [0.5, 0.4, 0.3, 0.2, 0.1]  # Natural frequencies of each stage
 damping_factor = 0.1  # Exponential decay
 time = np.linspace(0, 60, 800)  # Time for the animation
 
+# Displacement of every stage over the whole (fixed) time grid: shape (num_stages, len(time))
+displacements = (np.asarray(amplitudes)[:, None]
+                 * np.exp(-damping_factor * time)[None, :]
+                 * np.sin(2 * np.pi * np.asarray(frequencies)[:, None] * time[None, :]))
+# Amplitude history shown in the resonance subplot, filled once for all frames
+amp_hist = np.abs(displacements)
+# Equilibrium height of each stage, hanging down from the top suspension point
+y_positions = sum(lengths) - np.cumsum(lengths)
+
 # Initialize plot
 #fig, ax = plt.subplots()
 fig, (ax, resonance_ax) = plt.subplots(1, 2, figsize=(12, 6))
@@ -37,9 +46,9 @@ masses = []
 resonance_lines = []
 mass_size = [7, 7, 7, 7, 13]
 mass_style = ['*', '*','*','*','o']
-blues = cm.get_cmap("Blues", 10)
-print(blues)
-mass_color = [blues(6), blues(7), blues(8), blues(9),  '#d62728']
+# Entries 6-9 of the 10-level "Blues" colormap, inlined
+mass_color = [(0.216, 0.529, 0.754, 1.0), (0.108, 0.415, 0.688, 1.0),
+              (0.031, 0.303, 0.590, 1.0), (0.031, 0.188, 0.420, 1.0), '#d62728']
 wei = [1, 2, 3, 4, 5]
 # Create lines and masses for each stage
 for i in range(num_stages):
@@ -62,37 +71,29 @@ def init():
     return lines + masses + resonance_lines
 
 # Animation function
-def animate(t):
+def animate(k):
+    x_positions = np.cumsum(displacements[:, k])
     x_prev, y_prev = 0, sum(lengths)
-    positions = []  # To store each stage's end positions
-    resonance_data = [[] for _ in range(num_stages)]  # For resonance plot
 
     for i in range(num_stages):
-        # Compute displacement with resonance and damping
-        x_displacement = (
-            amplitudes[i]
-            * np.exp(-damping_factor * t)
-            * np.sin(2 * np.pi * frequencies[i] * t)
-        )
-        x_curr, y_curr = x_prev + x_displacement, y_prev - lengths[i]
-        positions.append((x_curr, y_curr))
+        x_curr, y_curr = x_positions[i], y_positions[i]
 
         # Update lines and masses
         lines[i].set_data([x_prev, x_curr], [y_prev, y_curr])
-        masses[i].set_data(x_curr, y_curr)
-
-        # Store resonance data
-        resonance_data[i].append(abs(x_displacement))
+        masses[i].set_data([x_curr], [y_curr])
         x_prev, y_prev = x_curr, y_curr
 
-    # Update resonance subplot
+    # Update resonance subplot with the amplitude history up to this frame
+    # (slices are views into the preallocated arrays; the time window is shared by all stages)
+    t_hist = time[:k + 1]
     for i, res_line in enumerate(resonance_lines):
-        res_line.set_data(time[:int(t * 20)], resonance_data[i])
+        res_line.set_xdata(t_hist)
+        res_line.set_ydata(amp_hist[i, :k + 1])
 
     return lines + masses + resonance_lines
 
 # Create animation
-ani = FuncAnimation(fig, animate, frames=time, init_func=init, blit=False, interval=60)
+ani = FuncAnimation(fig, animate, frames=range(len(time)), init_func=init, blit=True, interval=60)
 
 plt.suptitle("Super Attenuator with multiple stages")
 plt.show()
@@ -19,6 +19,16 @@ total_time = 50  # seconds
 frames = 1000
 time_array = np.linspace(0, total_time, frames)
 
+# Displacement of every mass over the whole (fixed) time grid, shape (num_stages, frames):
+# d_i(t) = amplitude[i] * exp(-damping*t) * sin(2π*frequency[i]*t)
+displacements = (np.asarray(amplitudes)[:, None]
+                 * np.exp(-damping_factor * time_array)[None, :]
+                 * np.sin(2 * np.pi * np.asarray(frequencies)[:, None] * time_array[None, :]))
+# Horizontal position of each mass is the cumulative sum of the displacements below it,
+# its equilibrium height the cumulative rod length below it (test mass at y = 0).
+x_table = np.cumsum(displacements, axis=0)
+y_positions = np.concatenate(([0.0], np.cumsum(rod_lengths)))
+
 # --- Set up the plot ---
 # We choose y = 0 for the test mass, and the chain will build upward.
 fig, ax = plt.subplots()
@@ -68,64 +78,40 @@ def init():
 # --- Animation Function ---
 def animate(frame):
     global stages_to_draw
-    t = time_array[frame]
 
     # Every ~100 frames (~5 seconds), add one more stage until the full chain is built.
     if frame % 250 == 0 and stages_to_draw < num_stages:
         stages_to_draw += 1
 
-    # Compute horizontal displacements for each stage currently drawn.
-    # For stage i (0-indexed), define: d_i = amplitude[i] * exp(-damping*t) * sin(2π*frequency[i]*t)
-    displacements = [amplitudes[i] * np.exp(-damping_factor * t) * np.sin(2 * np.pi * frequencies[i] * t)
-                     for i in range(stages_to_draw)]
-
-    # Determine positions:
-    # For stage 1 (test mass), equilibrium is at (0, 0); its actual position is (d_0, 0)
-    positions = []
-    x0 = displacements[0]
-    y0 = 0
-    positions.append((x0, y0))
-
-    # For each subsequent stage i (i = 2,..., stages_to_draw),
-    # the equilibrium vertical position is the cumulative sum of rod lengths.
-    # The horizontal position is the cumulative sum of displacements.
-    for i in range(1, stages_to_draw):
-        y_eq = sum(rod_lengths[:i])  # equilibrium y for stage i+1
-        x_val = sum(displacements[:i + 1])
-        positions.append((x_val, y_eq))
+    # Positions of the drawn stages at this frame, looked up from the precomputed tables.
+    x_positions = x_table[:stages_to_draw, frame]
 
     # Update drawing:
 
     # For Stage 1, only update its mass marker.
-    masses[0].set_data(positions[0][0], positions[0][1])
+    masses[0].set_data([x_positions[0]], [y_positions[0]])
     # Place its stage label to the left and slightly above its marker.
     stage_labels[0].set_text("mirror")
-    stage_labels[0].set_position((positions[0][0] - 0.4, positions[0][1] + 0.2))
-    # For stage 1, draw only the mass.
-    masses[0].set_data(positions[0][0], positions[0][1])
+    stage_labels[0].set_position((x_positions[0] - 0.4, y_positions[0] + 0.2))
 
     # For stages 2 and above, draw a rod from the previous mass to the current mass, and draw the mass.
     for i in range(1, stages_to_draw):
-        x_prev, y_prev = positions[i - 1]
-        x_curr, y_curr = positions[i]
+        x_prev, y_prev = x_positions[i - 1], y_positions[i - 1]
+        x_curr, y_curr = x_positions[i], y_positions[i]
         lines[i].set_data([x_prev, x_curr], [y_prev, y_curr])
-        masses[i].set_data(x_curr, y_curr)
+        masses[i].set_data([x_curr], [y_curr])
         stage_labels[i].set_text(f"S{i}")
         stage_labels[i].set_position((x_curr - 0.4, y_curr + 0.2))
 
-    # Clear objects for stages not yet drawn.
-    for i in range(stages_to_draw, num_stages):
-        lines[i].set_data([], [])
-        masses[i].set_data([], [])
-        stage_labels[i].set_text("")
-
     # Display the test mass displacement (its horizontal coordinate).
-    disp_text.set_text(f"mirror motion: \n {positions[0][0]:.3f} m")
+    disp_text.set_text(f"mirror motion: \n {x_positions[0]:.3f} m")
 
-    return lines + masses + [disp_text] +stage_labels
+    # Stages not yet drawn are still empty from init() (stages_to_draw only grows), so only
+    # the drawn rods (stage 1 has none), masses and labels need to be blitted.
+    return lines[1:stages_to_draw] + masses[:stages_to_draw] + [disp_text] + stage_labels[:stages_to_draw]
 
 
-ani = FuncAnimation(fig, animate, frames=frames, init_func=init, blit=False, interval=25)
+ani = FuncAnimation(fig, animate, frames=frames, init_func=init, blit=True, interval=25)
 plt.show()
 #ani.save('animation_pub.gif', writer='pillow')
 
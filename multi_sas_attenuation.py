@@ -13,12 +13,16 @@ All transfer functions are |X / X0|(f) from base motion to payload motion.
 
 # --- Frequency grid ---
 f = np.logspace(-3, 2, 4000)
-w = 2 * np.pi * f
+# float32 grid -> all H_* come out as complex64 (plenty for log-log plots, half the memory traffic)
+w = (2 * np.pi * f).astype(np.float32)
+# ω² and iω on the grid, computed once; each H_* takes the one it uses
+w2 = w * w
+jw = 1j * w
 
 # --------------------------
 # Inverted Pendulum (IP)
 # ---------------------------
-def H_ip_basic(w, f0=0.1, beta=0.07, phi=1e-4):
+def H_ip_basic(w2, f0=0.1, beta=0.07, phi=1e-4):
     """
     Inverted Pendulum (before percussion clearance).
 
@@ -33,11 +37,11 @@ def H_ip_basic(w, f0=0.1, beta=0.07, phi=1e-4):
     Large β causes the high-frequency "flattening" (bad isolation).
     """
     w0 = 2 * np.pi * f0
-    num = (w0**2) * (1 + 1j * phi) + beta * (w**2)
-    den = (w0**2) * (1 + 1j * phi) - (w**2)
+    num = (w0**2) * (1 + 1j * phi) + beta * w2
+    den = (w0**2) * (1 + 1j * phi) - w2
     return num / den
 
-def H_ip_countermass(w, f0=0.1, gamma=0.01, phi=1e-4):
+def H_ip_countermass(w2, f0=0.1, gamma=0.01, phi=1e-4):
     """
     Inverted Pendulum after counter-mass tuning (percussion clearance).
 
@@ -45,20 +49,47 @@ def H_ip_countermass(w, f0=0.1, gamma=0.01, phi=1e-4):
     due to counter-masses and lighter legs (percussion point closer to hinge).
     """
     w0 = 2 * np.pi * f0
-    num = (w0**2) * (1 + 1j * phi) + gamma * (w**2)
-    den = (w0**2) * (1 + 1j * phi) - (w**2)
+    num = (w0**2) * (1 + 1j * phi) + gamma * w2
+    den = (w0**2) * (1 + 1j * phi) - w2
     return num / den
 
+# ---------------------------
+# Cascades as one rational function
+# ---------------------------
+def cascade_poly(f0_list, kind="pend", Q=50.0, M=350.0, m=11.0, phi=1e-3, gamma=0.05):
+    """
+    Numerator / denominator coefficients (in s = iω, highest power first) of a
+    cascade of GAS (kind="gas") or pendulum (kind="pend") stages, obtained by
+    multiplying the per-stage polynomials from gas_stage_poly / pend_stage_poly.
+
+    The cascade is then evaluated with two polyvals instead of one pass per stage.
+    """
+    if kind not in ("gas", "pend"):
+        raise ValueError(f"unknown stage kind {kind!r}, expected 'gas' or 'pend'")
+    num, den = np.array([1.0 + 0j]), np.array([1.0 + 0j])
+    for f0 in f0_list:
+        if kind == "gas":
+            n, d = gas_stage_poly(f0, M=M, m=m, phi=phi, gamma=gamma)
+        else:
+            n, d = pend_stage_poly(f0, Q=Q)
+        num = np.polymul(num, n)
+        den = np.polymul(den, d)
+    return num, den
+
 # ---------------------------
 # GAS vertical filters
 # ---------------------------
-def H_gas_single(w, f0=0.3, M=350.0, m=110.0, phi=1e-3, gamma=0.05):
+def gas_stage_poly(f0=0.3, M=350.0, m=110.0, phi=1e-3, gamma=0.05):
     """
     Single GAS filter (vertical) TF from base to payload:
 
         H(ω) = [ ω0^2 (1 + i φ) + (m/M) ω^2 ] /
                [ ω0^2 (1 + i φ) - ω^2 + i (γ/M) ω ]
 
+    returned as (num, den) coefficients in s = iω:
+
+        [ -(m/M) s^2 + ω0^2 (1 + i φ) ] / [ s^2 + (γ/M) s + ω0^2 (1 + i φ) ]
+
     Parameters:
         f0    : GAS resonance (Hz)
         M     : payload mass (kg)
@@ -71,31 +102,32 @@ def H_gas_single(w, f0=0.3, M=350.0, m=110.0, phi=1e-3, gamma=0.05):
         - Above resonance the magnitude rolls off.
     """
     w0 = 2 * np.pi * f0
-    num = (w0**2) * (1 + 1j * phi) + (m / M) * (w**2)
-    den = (w0**2) * (1 + 1j * phi) - (w**2) + 1j * (gamma / M) * w
-    return num / den
+    k0 = (w0**2) * (1 + 1j * phi)
+    return np.array([-(m / M), 0.0, k0]), np.array([1.0, gamma / M, k0])
 
 
-def H_gas_cascade(w, f0_list, M=350.0, m=11.0, phi=1e-3, gamma=0.05):
+def H_gas_cascade(jw, f0_list, M=350.0, m=11.0, phi=1e-3, gamma=0.05):
     """
     Cascade multiple GAS filters (multiply transfer functions).
     f0_list : list of resonant frequencies for each stage (Hz).
     """
-    H = np.ones_like(w, dtype=complex)
-    for f0 in f0_list:
-        H *= H_gas_single(w, f0=f0, M=M, m=m, phi=phi, gamma=gamma)
-    return H
+    num, den = cascade_poly(f0_list, kind="gas", M=M, m=m, phi=phi, gamma=gamma)
+    return np.polyval(num.astype(jw.dtype), jw) / np.polyval(den.astype(jw.dtype), jw)
 
 
 # ---------------------------
 # Horizontal pendulum(s)
 # ---------------------------
-def H_pend_single(w, f0=0.5, Q=50.0):
+def pend_stage_poly(f0=0.5, Q=50.0):
     """
     Simple pendulum (horizontal) TF from base to payload:
 
         H(ω) = ω0^2 / ( ω0^2 - ω^2 + i ω ω0 / Q )
 
+    returned as (num, den) coefficients in s = iω:
+
+        ω0^2 / [ s^2 + (ω0/Q) s + ω0^2 ]
+
     Parameters:
         f0 : pendulum resonance (Hz) with ω0 = 2π f0
         Q  : quality factor (losses)
@@ -103,29 +135,25 @@ def H_pend_single(w, f0=0.5, Q=50.0):
     Above resonance, |H| ~ (ω0/ω)^2 -> excellent horizontal isolation.
     """
     w0 = 2 * np.pi * f0
-    num = w0**2
-    den = (w0**2) - (w**2) + 1j * w * w0 / Q
-    return num / den
+    return np.array([w0**2 + 0j]), np.array([1.0, w0 / Q, w0**2 + 0j])
 
 
-def H_pend_cascade(w, f0_list, Q=50.0):
+def H_pend_cascade(jw, f0_list, Q=50.0):
     """
     Cascade multiple horizontal pendulums (multiply transfer functions).
     f0_list : list of resonant frequencies (Hz).
     """
-    H = np.ones_like(w, dtype=complex)
-    for f0 in f0_list:
-        H *= H_pend_single(w, f0=f0, Q=Q)
-    return H
+    num, den = cascade_poly(f0_list, kind="pend", Q=Q)
+    return np.polyval(num.astype(jw.dtype), jw) / np.polyval(den.astype(jw.dtype), jw)
 
 # --- Compute transfer functions ---
-H_ip_before = H_ip_basic(w, f0=0.1, beta=0.07, phi=1e-4)
-H_ip_after  = H_ip_countermass(w, f0=0.1, gamma=0.01, phi=1e-4)
-H_gas_1 = H_gas_cascade(w, [0.2])
-H_gas_2 = H_gas_cascade(w, [0.2, 0.3])
-H_gas_3 = H_gas_cascade(w, [0.2, 0.3, 0.4])
-H_p1 = H_pend_cascade(w, [0.3])
-H_p2 = H_pend_cascade(w, [0.3, 0.5])
+H_ip_before = H_ip_basic(w2, f0=0.1, beta=0.07, phi=1e-4)
+H_ip_after  = H_ip_countermass(w2, f0=0.1, gamma=0.01, phi=1e-4)
+H_gas_1 = H_gas_cascade(jw, [0.2])
+H_gas_2 = H_gas_cascade(jw, [0.2, 0.3])
+H_gas_3 = H_gas_cascade(jw, [0.2, 0.3, 0.4])
+H_p1 = H_pend_cascade(jw, [0.3])
+H_p2 = H_pend_cascade(jw, [0.3, 0.5])
 H_chain = H_ip_after *  H_p2 
 
 # --- Plotting ---
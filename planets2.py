@@ -117,7 +117,9 @@ matplotlib.use("Qt5Agg")
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from matplotlib.patches import Circle
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
 
 # ==========================================================
 # Planetary data
@@ -157,9 +159,7 @@ sun = ax.scatter(0, 0, s=350, color="yellow", zorder=10)
 # ==========================================================
 # Orbits & planets
 # ==========================================================
-planet_dots = []
 orbit_lines = []
-angles = []
 
 for name, a, T, color, size in planets:
     r = scale_r(a)
@@ -168,26 +168,39 @@ for name, a, T, color, size in planets:
                      color="white", lw=0.6, alpha=0.3)
     orbit_lines.append(orbit)
 
-    dot = ax.scatter([], [], s=size**2, color=color, zorder=5)
-    planet_dots.append(dot)
+# All planets in a single PathCollection, updated with one (n, 2) offsets array per frame
+sizes = np.array([p[4] for p in planets])**2
+colors = [p[3] for p in planets]
+planet_dots = ax.scatter(np.zeros(len(planets)), np.zeros(len(planets)),
+                         s=sizes, c=colors, zorder=5)
 
-    angles.append(np.random.uniform(0, 2*np.pi))
+radii = scale_r(np.array([p[1] for p in planets]))
+omegas = 2*np.pi / np.array([p[2] for p in planets])
+angles = np.random.uniform(0, 2*np.pi, size=len(planets))
 
 # ==========================================================
 # Earth sphere (initially hidden)
 # ==========================================================
-earth_sphere = Circle((0, 0), 0.0,
-                      facecolor="#1f77b4",
-                      edgecolor="white",
-                      lw=1.2,
-                      zorder=30,
-                      alpha=0.0)
+# Both discs share the cached unit-circle path; only their Affine2D
+# (scale = radius, translate = center) changes per frame.
+unit_circle = Path.unit_circle()
+earth_tf = Affine2D().scale(0.0)
+shade_tf = Affine2D().scale(0.0)
+
+earth_sphere = PathPatch(unit_circle,
+                         transform=earth_tf + ax.transData,
+                         facecolor="#1f77b4",
+                         edgecolor="white",
+                         lw=1.2,
+                         zorder=30,
+                         alpha=0.0)
 ax.add_patch(earth_sphere)
 
-shade = Circle((0, 0), 0.0,
-               facecolor="black",
-               alpha=0.25,
-               zorder=31)
+shade = PathPatch(unit_circle,
+                  transform=shade_tf + ax.transData,
+                  facecolor="black",
+                  alpha=0.25,
+                  zorder=31)
 ax.add_patch(shade)
 
 # ==========================================================
@@ -207,16 +220,13 @@ earth_zoom_lim = 0.15
 # ==========================================================
 def update(frame):
     # --- Planet motion ---
-    for i, (name, a, T, color, size) in enumerate(planets):
-        omega = 2*np.pi / T
-        angles[i] += omega * dt
-        r = scale_r(a)
-        x = r * np.cos(angles[i])
-        y = r * np.sin(angles[i])
-        planet_dots[i].set_offsets([x, y])
+    angles[:] += omegas * dt
+    x = radii * np.cos(angles)
+    y = radii * np.sin(angles)
+    planet_dots.set_offsets(np.column_stack((x, y)))
 
     # Earth's current position
-    ex, ey = planet_dots[earth_index].get_offsets()[0]
+    ex, ey = x[earth_index], y[earth_index]
 
     # --- Zoom logic ---
     if frame < zoom1_start:
@@ -250,12 +260,11 @@ def update(frame):
             orb.set_alpha(0.3*(1 - f))
 
         # Grow Earth sphere at Earth's position
-        earth_sphere.center = (ex, ey)
-        earth_sphere.radius = 0.08 * f
+        radius = 0.08 * f
+        earth_tf.clear().scale(radius).translate(ex, ey)
         earth_sphere.set_alpha(f)
 
-        shade.center = (ex + 0.02*f, ey - 0.02*f)
-        shade.radius = earth_sphere.radius
+        shade_tf.clear().scale(radius).translate(ex + 0.02*f, ey - 0.02*f)
 
     else:
         cx, cy = ex, ey
@@ -264,7 +273,7 @@ def update(frame):
     ax.set_xlim(cx - lim, cx + lim)
     ax.set_ylim(cy - lim, cy + lim)
 
-    return planet_dots
+    return (planet_dots,)
 
 ax.set_xlim(-full_lim, full_lim)
 ax.set_ylim(-full_lim, full_lim)
@@ -272,6 +281,7 @@ ax.set_ylim(-full_lim, full_lim)
 plt.title("Solar System → Earth (Correct Camera Lock)",
           color="white", pad=20)
 
+# No blitting: the camera zoom/lock changes the axis limits, so the background is not static
 ani = FuncAnimation(fig, update, interval=40, blit=False)
 plt.show()
 
@@ -1,17 +1,23 @@
+import math
+import sys
 import numpy as np
 import matplotlib
-matplotlib.use("Qt5Agg")
 # ---- Force an interactive backend (important in many IDEs) ----
-# Try QtAgg first, then TkAgg.
-for bk in ("QtAgg", "TkAgg"):
-    try:
-        matplotlib.use(bk, force=True)
-        break
-    except Exception:
-        pass
+# Try QtAgg first, then TkAgg; keep the first one that loads. Skipped when pyplot is already
+# running one of them, so re-running the script in an IDE doesn't reinitialize the GUI backend.
+# (Before pyplot is imported, get_backend() could trigger matplotlib's own backend pick, so it
+# is only asked once pyplot is loaded; until then use() just sets the rcParam.)
+if not ("matplotlib.pyplot" in sys.modules
+        and matplotlib.get_backend().lower() in ("qtagg", "qt5agg", "tkagg")):
+    for bk in ("QtAgg", "TkAgg"):
+        try:
+            matplotlib.use(bk, force=True)
+            break
+        except Exception:
+            pass
 
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FuncAnimation, ArtistAnimation
 
 # -----------------------
 # Physical constants (SI)
@@ -40,33 +46,64 @@ omega_s = 2 * np.pi / T_s
 N = 360
 theta_earth = np.linspace(0, 2*np.pi, N, endpoint=False)  # fixed points on Earth's surface (Earth frame)
 
+# The surface grid never changes: precompute its trig once
+COS_TH = np.cos(theta_earth)
+SIN_TH = np.sin(theta_earth)
+REF_X = R_E * COS_TH   # undisturbed ocean (reference circle)
+REF_Y = R_E * SIN_TH
+
 dt = 1200.0  # simulated seconds per frame (20 minutes)
 visual_bulge_scale = 1.2e5  # purely visual scale factor
 response_relax = 0.20       # ocean "response" smoothing 0..1
+playback_frames = 0         # > 0: precompute this many frames in one pass and play them back
+info_every = 10             # refresh the diagnostics text every this many frames
+use_numba = False           # opt-in Numba kernel for the tide step (only pays off on very long runs)
 
 # -----------------------
 # Helpers
 # -----------------------
-def unit(v):
-    n = np.linalg.norm(v)
-    return v / n if n != 0 else v
-
-def rot2(a):
-    c, s = np.cos(a), np.sin(a)
-    return np.array([[c, -s],
-                     [s,  c]])
-
-def tidal_potential(M, D, cos_gamma, R=R_E):
-    """
-    Leading-order tidal potential at Earth's surface (J/kg):
-    U_tide = - (G M / (2 D^3)) * R^2 * (3 cos^2(gamma) - 1)
-    """
-    return - (G * M / (2.0 * D**3)) * (R**2) * (3.0 * cos_gamma**2 - 1.0)
-
-def body_dir(t, omega, phase0=0.0):
-    """Unit direction from Earth to body in inertial frame (2D)."""
-    ang = omega * t + phase0
-    return np.array([np.cos(ang), np.sin(ang)])
+# Leading-order tidal potential at Earth's surface (J/kg):
+#   U_tide = - K * (3 cos^2(gamma) - 1),   K = G M R_E^2 / (2 D^3)
+# The prefactors are constant, so compute them once for Moon and Sun.
+K_M = G * M_m * R_E**2 / (2.0 * D_m**3)
+K_S = G * M_s * R_E**2 / (2.0 * D_s**3)
+
+# The drawn bulge is visual_bulge_scale * (K_M (3 cos^2 g_m - 1) + K_S (3 cos^2 g_s - 1)) minus
+# its mean over the surface grid. On a uniform grid the mean of cos^2(theta - a) is exactly 1/2
+# for any a, so that mean is the constant visual_bulge_scale * (K_M + K_S) / 2. Folding it with
+# the -1 terms, the bulge is A_M cos^2 g_m + A_S cos^2 g_s - BULGE_DC.
+A_M = 3.0 * visual_bulge_scale * K_M
+A_S = 3.0 * visual_bulge_scale * K_S
+BULGE_DC = 1.5 * visual_bulge_scale * (K_M + K_S)
+
+# Relative tidal strength of Moon vs Sun (M / D^3), shown in the diagnostics
+MOON_STRENGTH = M_m / D_m**3
+SUN_STRENGTH = M_s / D_s**3
+RATIO = MOON_STRENGTH / SUN_STRENGTH
+
+# In the Earth frame the Moon/Sun directions sit at angle (omega*t + phase0 - omega_E*t), which
+# advances by a fixed (omega - omega_E)*dt per frame, so step them with the rotation recurrence
+#   c' = c cos(w dt) - s sin(w dt),  s' = s cos(w dt) + c sin(w dt)
+# instead of evaluating trig every frame.  _dirs = [frame, moon cos, moon sin, sun cos, sun sin]
+_step_m = (math.cos((omega_m - omega_E) * dt), math.sin((omega_m - omega_E) * dt))
+_step_s = (math.cos((omega_s - omega_E) * dt), math.sin((omega_s - omega_E) * dt))
+_dirs = [None, 0.0, 0.0, 0.0, 0.0]
+
+def body_dirs(frame):
+    """Unit directions from Earth to Moon and Sun in the (rotating) Earth frame at a given frame."""
+    if _dirs[0] is not None and frame == _dirs[0] + 1:
+        _, mc, ms, sc, ss = _dirs
+        _dirs[:] = [frame,
+                    mc * _step_m[0] - ms * _step_m[1], ms * _step_m[0] + mc * _step_m[1],
+                    sc * _step_s[0] - ss * _step_s[1], ss * _step_s[0] + sc * _step_s[1]]
+    elif frame != _dirs[0]:
+        # first call or a jump in frames (e.g. a restart): evaluate directly
+        t = frame * dt
+        phi = omega_E * t
+        ang_m = omega_m * t - phi
+        ang_s = omega_s * t + np.pi/3 - phi
+        _dirs[:] = [frame, math.cos(ang_m), math.sin(ang_m), math.cos(ang_s), math.sin(ang_s)]
+    return _dirs[1], _dirs[2], _dirs[3], _dirs[4]
 
 # -----------------------
 # Figure setup
@@ -87,18 +124,11 @@ ax.set_yticks([])
 earth = plt.Circle((0, 0), R_E, color="#1f77b4", alpha=0.95)
 ax.add_patch(earth)
 
-# A simple "continent-like" blob drawn on Earth, rotated each frame (visual cue)
-blob_t = np.linspace(0, 2*np.pi, 300)
-blob_r = 0.55 * R_E * (1.0 + 0.15*np.sin(3*blob_t) + 0.08*np.sin(7*blob_t + 0.9))
-blob_x0 = blob_r * np.cos(blob_t)
-blob_y0 = blob_r * np.sin(blob_t)
-#blob_line, = ax.plot([], [], lw=2.0, alpha=0.65, color="red")  # green
-
 # Rotating meridian line (another rotation cue)
 meridian, = ax.plot([], [], lw=1.5, alpha=0.7, color="white")
 
-# Ocean reference and bulge ring
-ocean_ref,  = ax.plot([], [], lw=1.2, alpha=0.25, color="white")
+# Ocean reference (static, part of the blitted background) and bulge ring
+ocean_ref,  = ax.plot(REF_X, REF_Y, lw=1.2, alpha=0.25, color="white")
 ocean_line, = ax.plot([], [], lw=2.8, color="#00e5ff")
 
 # Moon/Sun direction markers (placed near edge for visibility)
@@ -115,103 +145,153 @@ info_text = ax.text(
 
 plt.title("Newtonian Ocean Tides (Moon + Sun) — Earth rotates, bulges move", color="white", pad=14)
 
-prev_bulge = np.zeros(N)
+# Per-frame work buffers, allocated once and updated in place by update()
+_cos_g_m = np.empty(N)
+_cos_g_s = np.empty(N)
+_bulge_target = np.empty(N)
+_bulge = np.zeros(N)      # smoothed ocean response (state carried between frames)
+_tmp = np.empty(N)
+_xy = np.empty((2, N))    # ocean ring; rows are contiguous x / y views handed to the line
+_mer_x = np.zeros(2)      # meridian end points: centre -> rotated (0, R_E)
+_mer_y = np.zeros(2)
+
+def _tide_step_loop(cos_th, sin_th, mx, my, sx, sy, a_m, a_s, dc, relax, r0, bulge, x, y):
+    # one fused pass over the surface grid: cos(gamma), bulge target, smoothing, ring coordinates
+    for i in range(cos_th.size):
+        cg_m = cos_th[i] * mx + sin_th[i] * my
+        cg_s = cos_th[i] * sx + sin_th[i] * sy
+        target = a_m * cg_m * cg_m + a_s * cg_s * cg_s - dc
+        bulge[i] = (1.0 - relax) * bulge[i] + relax * target
+        r = r0 + bulge[i]
+        x[i] = r * cos_th[i]
+        y[i] = r * sin_th[i]
+
+def _tide_step_numpy(cos_th, sin_th, mx, my, sx, sy, a_m, a_s, dc, relax, r0, bulge, x, y):
+    # same computation as _tide_step_loop with in-place ufuncs on the module buffers
+    # cos(gamma) = rhat · dir_body (both in Earth frame), with rhat = (cos_th, sin_th)
+    np.multiply(cos_th, mx, out=_cos_g_m)
+    np.add(_cos_g_m, np.multiply(sin_th, my, out=_tmp), out=_cos_g_m)
+    np.multiply(cos_th, sx, out=_cos_g_s)
+    np.add(_cos_g_s, np.multiply(sin_th, sy, out=_tmp), out=_cos_g_s)
+
+    np.multiply(_cos_g_m, _cos_g_m, out=_bulge_target)
+    np.multiply(_bulge_target, a_m, out=_bulge_target)
+    np.multiply(_cos_g_s, _cos_g_s, out=_tmp)
+    np.multiply(_tmp, a_s, out=_tmp)
+    np.add(_bulge_target, _tmp, out=_bulge_target)
+    np.subtract(_bulge_target, dc, out=_bulge_target)
+
+    np.multiply(bulge, 1 - relax, out=bulge)
+    np.add(bulge, np.multiply(_bulge_target, relax, out=_tmp), out=bulge)
+
+    np.add(bulge, r0, out=_tmp)  # R
+    np.multiply(_tmp, cos_th, out=x)
+    np.multiply(_tmp, sin_th, out=y)
+
+if use_numba:
+    from numba import njit  # imported only when enabled: import + compile cost ~0.3 s per launch
+    tide_step = njit(cache=True, fastmath=True)(_tide_step_loop)
+else:
+    tide_step = _tide_step_numpy
 
 def init():
-    # Reference circle in Earth frame
-    ref_x = R_E * np.cos(theta_earth)
-    ref_y = R_E * np.sin(theta_earth)
-    ocean_ref.set_data(ref_x, ref_y)
-    ocean_line.set_data(ref_x, ref_y)
+    # Undisturbed ocean on the reference circle
+    ocean_line.set_data(REF_X, REF_Y)
 
     # Meridian initial
     meridian.set_data([0, 0], [-R_E, R_E])
 
-    return (meridian, ocean_ref, ocean_line,
-            moon_scatter, sun_scatter, moon_dir_line, sun_dir_line, info_text)
+    # Only the artists update() changes; everything else stays in the blit background
+    return (meridian, ocean_line, info_text)
 
 def update(frame):
-    global prev_bulge
     t = frame * dt
 
     # Earth rotation angle
     phi = omega_E * t
+    cph, sph = math.cos(phi), math.sin(phi)
 
     # ---- Rotate Earth features for visible rotation ----
-    Rphi = rot2(phi)
-    blob_xy = Rphi @ np.vstack([blob_x0, blob_y0])
-    #blob_line.set_data(blob_xy[0], blob_xy[1])
-
-    # Meridian (a radius line) rotated with Earth
-    m_end = Rphi @ np.array([0.0, R_E])
-    meridian.set_data([0, m_end[0]], [0, m_end[1]])
+    # Meridian (a radius line) rotated with Earth: R(phi) @ (0, R_E), written out
+    _mer_x[1] = -sph * R_E
+    _mer_y[1] = cph * R_E
+    meridian.set_data(_mer_x, _mer_y)
 
     # ---- Compute tide forcing in the EARTH FRAME ----
-    # Moon/Sun directions in inertial frame:
-    m_dir_in = body_dir(t, omega_m, phase0=0.0)
-    s_dir_in = body_dir(t, omega_s, phase0=np.pi/3)
+    # Moon/Sun directions in the Earth frame, i.e. with the Earth rotation already undone
+    # (angle omega*t - phi rather than rotating the inertial direction by -phi):
+    mx, my, sx, sy = body_dirs(frame)
 
-    # Convert to Earth frame by undoing Earth rotation:
-    Rmphi = rot2(-phi)
-    m_dir = unit(Rmphi @ m_dir_in)
-    s_dir = unit(Rmphi @ s_dir_in)
+    # Bulge follows -(U_m + U_s) with the mean removed analytically (average radius fixed),
+    # relaxed into _bulge, then the ocean ring in Earth frame (bulges move over fixed surface points)
+    tide_step(COS_TH, SIN_TH, mx, my, sx, sy, A_M, A_S, BULGE_DC, response_relax, R_E,
+              _bulge, _xy[0], _xy[1])
+    ocean_line.set_data(_xy[0], _xy[1])
 
-    # Surface unit vectors in Earth frame (fixed grid on Earth):
-    rhat = np.stack([np.cos(theta_earth), np.sin(theta_earth)], axis=1)  # (N,2)
-
-    # cos(gamma) = rhat · dir_body (both in Earth frame)
-    cos_g_m = rhat @ m_dir
-    cos_g_s = rhat @ s_dir
+    # ---- Show Moon/Sun directions (in inertial frame, but draw relative to Earth) ----
+    # For drawing in the plot (Earth frame), we can just use (mx, my) and (sx, sy) directly.
+    # (add the artists back to the returned tuple if these are re-enabled, for blitting)
+    # moon_dir_line.set_data([0, 1.25*R_E*mx], [0, 1.25*R_E*my])
+    # sun_dir_line.set_data([0, 1.25*R_E*sx], [0, 1.25*R_E*sy])
+
+    # moon_scatter.set_offsets([1.50*R_E*mx, 1.50*R_E*my])
+    # sun_scatter.set_offsets([1.50*R_E*sx, 1.50*R_E*sy])
+
+    # Diagnostics, refreshed every few frames only (too fast to read anyway). info_text is
+    # still returned every frame so blitting keeps drawing the last text in between.
+    if frame % info_every == 0:
+        alignment = min(1.0, max(-1.0, mx * sx + my * sy))
+        sim_days = t / 86400.0
+
+        info_text.set_text(
+            "Tidal bulges from differential gravity\n"
+            f"Sim time: {sim_days:7.2f} days\n"
+            f"Earth rotation: {math.degrees(phi)%360:6.1f}°\n"
+            f"Moon tidal strength / Sun: {RATIO:5.2f}×\n"
+            f"Moon–Sun alignment (cos): {alignment: .3f}\n"
+            "\n"
+            # "Bulges move over Earth as Earth rotates.\n"
+            # "Alignment near ±1 => spring tides; near 0 => neap tides."
+        )
+
+    return (meridian, ocean_line, info_text)
+
+def precompute_tides(n_frames):
+    """
+    Meridian end points and ocean ring for frames 0..n_frames-1 in one vectorized pass.
+    Same model as update(), with the body directions taken in the Earth frame directly
+    (angle - phi) and the response smoothing applied as a 1-pole IIR along time.
+    """
+    from scipy.signal import lfilter  # only needed for playback; keeps scipy out of the live path
 
-    U_m = tidal_potential(M_m, D_m, cos_g_m)
-    U_s = tidal_potential(M_s, D_s, cos_g_s)
+    t = np.arange(n_frames) * dt
+    phi = omega_E * t
+    ang_m = omega_m * t - phi
+    ang_s = omega_s * t + np.pi/3 - phi
 
-    bulge_target = visual_bulge_scale * (-(U_m + U_s))
-    bulge_target -= np.mean(bulge_target)  # keep average radius fixed
+    cos_g_m = COS_TH[None, :] * np.cos(ang_m)[:, None] + SIN_TH[None, :] * np.sin(ang_m)[:, None]
+    cos_g_s = COS_TH[None, :] * np.cos(ang_s)[:, None] + SIN_TH[None, :] * np.sin(ang_s)[:, None]
+    bulge_target = A_M * cos_g_m**2 + A_S * cos_g_s**2 - BULGE_DC
 
-    # Smooth response
-    bulge = (1 - response_relax) * prev_bulge + response_relax * bulge_target
-    prev_bulge = bulge
+    # bulge[k] = (1 - relax) * bulge[k-1] + relax * bulge_target[k], starting from rest
+    bulge = lfilter([response_relax], [1.0, -(1.0 - response_relax)], bulge_target, axis=0)
 
-    # Ocean ring in Earth frame (bulges move over fixed surface points)
     R = R_E + bulge
-    x = R * np.cos(theta_earth)
-    y = R * np.sin(theta_earth)
-    ocean_line.set_data(x, y)
-
-    # ---- Show Moon/Sun directions (in inertial frame, but draw relative to Earth) ----
-    # For drawing in the plot (Earth frame), we can just use m_dir and s_dir directly.
-    # moon_dir_line.set_data([0, 1.25*R_E*m_dir[0]], [0, 1.25*R_E*m_dir[1]])
-    # sun_dir_line.set_data([0, 1.25*R_E*s_dir[0]], [0, 1.25*R_E*s_dir[1]])
-
-    # moon_vis = 1.50 * R_E * m_dir
-    # sun_vis  = 1.50 * R_E * s_dir
-    # moon_scatter.set_offsets([moon_vis[0], moon_vis[1]])
-    # sun_scatter.set_offsets([sun_vis[0], sun_vis[1]])
-
-    # Diagnostics
-    moon_strength = M_m / (D_m**3)
-    sun_strength  = M_s / (D_s**3)
-    ratio = moon_strength / sun_strength
-    alignment = float(np.clip(np.dot(m_dir, s_dir), -1, 1))
-    sim_days = t / 86400.0
-
-    info_text.set_text(
-        "Tidal bulges from differential gravity\n"
-        f"Sim time: {sim_days:7.2f} days\n"
-        f"Earth rotation: {np.degrees(phi)%360:6.1f}°\n"
-        f"Moon tidal strength / Sun: {ratio:5.2f}×\n"
-        f"Moon–Sun alignment (cos): {alignment: .3f}\n"
-        "\n"
-        # "Bulges move over Earth as Earth rotates.\n"
-        # "Alignment near ±1 => spring tides; near 0 => neap tides."
-    )
-
-    return (meridian, ocean_ref, ocean_line,
-            moon_scatter, sun_scatter, moon_dir_line, sun_dir_line, info_text)
+    return -R_E * np.sin(phi), R_E * np.cos(phi), R * COS_TH, R * SIN_TH
 
 
 # IMPORTANT: keep a reference to ani (don't let it be garbage-collected)
-ani = FuncAnimation(fig, update, init_func=init, interval=33, blit=False)
+if playback_frames > 0:
+    mer_x, mer_y, ring_x, ring_y = precompute_tides(playback_frames)
+    info_text.set_text("Tidal bulges from differential gravity\n"
+                       f"Precomputed playback: {playback_frames * dt / 86400.0:.2f} days")
+    frames_artists = []
+    for k in range(playback_frames):
+        mer, = ax.plot([0, mer_x[k]], [0, mer_y[k]], lw=1.5, alpha=0.7, color="white")
+        ring, = ax.plot(ring_x[k], ring_y[k], lw=2.8, color="#00e5ff")
+        frames_artists.append([mer, ring])
+    ani = ArtistAnimation(fig, frames_artists, interval=33, blit=True)
+else:
+    ani = FuncAnimation(fig, update, init_func=init, interval=33, blit=True)
 
 plt.show()